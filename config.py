@@ -1,5 +1,7 @@
+import functools
 import json
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -20,30 +22,56 @@ class Config:
     assistant_emoji: str
 
 
-def load_config() -> Config:
+@functools.lru_cache(maxsize=4)
+def _parse_openclaw_config(path: str, mtime_ns: int) -> dict:
+    return json.loads(Path(path).read_text())
+
+
+def read_openclaw_config(config_path: Path) -> dict:
+    # Cached per path and modification time, so edits are still picked up.
+    # The returned dict is shared between callers; don't mutate it.
+    return _parse_openclaw_config(str(config_path), config_path.stat().st_mtime_ns)
+
+
+def dig(data, *keys, default=None):
+    # Walk nested dicts, returning default on the first missing key or
+    # non-dict value instead of building empty dicts for each miss
+    for key in keys:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+def load_config(env: Mapping[str, str] | None = None) -> Config:
+    if env is None:
+        env = os.environ
+
     home = Path.home()
     config_path = home / ".openclaw" / "openclaw.json"
 
     openclaw_config: dict = {}
     try:
-        openclaw_config = json.loads(config_path.read_text())
+        openclaw_config = read_openclaw_config(config_path)
         print(f"Loaded {config_path}")
     except Exception as e:
         raise RuntimeError(f"Could not load openclaw.json: {e}")
 
     # Extract values from openclaw.json
     groq_api_key = (
-        os.environ.get("GROQ_API_KEY")
-        or openclaw_config.get("env", {}).get("vars", {}).get("GROQ_API_KEY")
+        env.get("GROQ_API_KEY")
+        or dig(openclaw_config, "env", "vars", "GROQ_API_KEY")
         or ""
     )
 
-    gateway_port = openclaw_config.get("gateway", {}).get("port", 18789)
-    gateway_token = openclaw_config.get("gateway", {}).get("auth", {}).get("token", "")
+    gateway_port = dig(openclaw_config, "gateway", "port", default=18789)
+    gateway_token = dig(openclaw_config, "gateway", "auth", "token", default="")
 
-    tts_config = openclaw_config.get("messages", {}).get("tts", {}).get("elevenlabs", {})
-    elevenlabs_api_key = os.environ.get("ELEVENLABS_API_KEY") or tts_config.get("apiKey", "")
-    elevenlabs_voice_id = os.environ.get("ELEVENLABS_VOICE_ID") or tts_config.get("voiceId", "")
+    tts_config = dig(openclaw_config, "messages", "tts", "elevenlabs", default={})
+    elevenlabs_api_key = env.get("ELEVENLABS_API_KEY") or dig(tts_config, "apiKey", default="")
+    elevenlabs_voice_id = env.get("ELEVENLABS_VOICE_ID") or dig(tts_config, "voiceId", default="")
 
     # Validate required config
     missing = []
@@ -66,28 +94,28 @@ def load_config() -> Config:
         raise RuntimeError(f"Invalid config values: {', '.join(invalid)}")
 
     # Auth token for signaling endpoint (required!)
-    auth_token = os.environ.get("OC_AUTH_TOKEN", "")
+    auth_token = env.get("OC_AUTH_TOKEN", "")
     if not auth_token:
         raise RuntimeError("OC_AUTH_TOKEN environment variable is required")
 
     # Branding
-    assistant_name = os.environ.get("ASSISTANT_NAME", "OpenClaw")
-    assistant_emoji = os.environ.get("ASSISTANT_EMOJI", "lobster")
+    assistant_name = env.get("ASSISTANT_NAME", "OpenClaw")
+    assistant_emoji = env.get("ASSISTANT_EMOJI", "lobster")
 
     # Chatterbox (local TTS)
-    chatterbox_url = os.environ.get("CHATTERBOX_URL")
-    chatterbox_voice = os.environ.get("CHATTERBOX_VOICE", "default")
+    chatterbox_url = env.get("CHATTERBOX_URL")
+    chatterbox_voice = env.get("CHATTERBOX_VOICE", "default")
 
     config = Config(
-        port=int(os.environ.get("PORT", "7860")),
+        port=int(env.get("PORT", "7860")),
         groq_api_key=groq_api_key,
-        gateway_url=os.environ.get("GATEWAY_URL", f"http://localhost:{gateway_port}"),
+        gateway_url=env.get("GATEWAY_URL", f"http://localhost:{gateway_port}"),
         gateway_token=gateway_token,
         elevenlabs_api_key=elevenlabs_api_key,
         elevenlabs_voice_id=elevenlabs_voice_id,
         chatterbox_url=chatterbox_url,
         chatterbox_voice=chatterbox_voice,
-        session_key=os.environ.get("SESSION_KEY", "agent:main:main"),
+        session_key=env.get("SESSION_KEY", "agent:main:main"),
         auth_token=auth_token,
         assistant_name=assistant_name,
         assistant_emoji=assistant_emoji,
@@ -6,23 +6,40 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 from pipecat.transports.smallwebrtc.connection import SmallWebRTCConnection
 
+from .frame_dispatcher import FrameDispatcher
+
 
 class BotStateNotifierProcessor(FrameProcessor):
+    __slots__ = ("_connection", "_dispatcher")
+
+    _MSG_SPEAKING = {"type": "state", "state": "speaking"}
+    _MSG_LISTENING = {"type": "state", "state": "listening"}
+
     def __init__(self, connection: SmallWebRTCConnection, **kwargs):
         super().__init__(**kwargs)
         self._connection = connection
+        self._dispatcher = FrameDispatcher({
+            BotStartedSpeakingFrame: self._on_bot_started_speaking,
+            BotStoppedSpeakingFrame: self._on_bot_stopped_speaking,
+        })
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, BotStartedSpeakingFrame):
-            self._send_state("speaking")
-
-        elif isinstance(frame, BotStoppedSpeakingFrame):
-            self._send_state("listening")
+        handler = self._dispatcher.get(type(frame))
+        if handler:
+            await handler(frame, direction)
+        else:
+            await self.push_frame(frame, direction)
 
+    async def _on_bot_started_speaking(
+        self, frame: BotStartedSpeakingFrame, direction: FrameDirection
+    ):
+        self._connection.send_app_message(self._MSG_SPEAKING)
         await self.push_frame(frame, direction)
 
-    def _send_state(self, state: str):
-        msg = {"type": "state", "state": state}
-        self._connection.send_app_message(msg)
+    async def _on_bot_stopped_speaking(
+        self, frame: BotStoppedSpeakingFrame, direction: FrameDirection
+    ):
+        self._connection.send_app_message(self._MSG_LISTENING)
+        await self.push_frame(frame, direction)
@@ -0,0 +1,25 @@
+from typing import Callable
+
+from pipecat.frames.frames import Frame
+
+
+class FrameDispatcher:
+    # Maps frame types to handlers with one dict lookup per frame. Subclasses
+    # of a registered type (e.g. LLMTextFrame for TextFrame) are resolved the
+    # first time they're seen and cached, so isinstance semantics are kept.
+    # Handlers are coroutines taking (frame, direction) and push the frame
+    # themselves; processors push unhandled frames unchanged.
+    def __init__(self, handlers: dict[type[Frame], Callable]):
+        self._handlers = handlers
+        self._cache: dict[type[Frame], Callable | None] = dict(handlers)
+
+    def get(self, frame_type: type[Frame]) -> Callable | None:
+        try:
+            return self._cache[frame_type]
+        except KeyError:
+            handler = next(
+                (h for t, h in self._handlers.items() if issubclass(frame_type, t)),
+                None,
+            )
+            self._cache[frame_type] = handler
+            return handler
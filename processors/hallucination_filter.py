@@ -1,52 +1,179 @@
+import functools
 import re
+from collections.abc import Iterable
+from enum import StrEnum
+from loguru import logger
 from pipecat.frames.frames import Frame, TranscriptionFrame
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 
-HALLUCINATION_PATTERNS = [
-    re.compile(r"^thanks?\s*(you)?\s*(for\s+watching)?$", re.IGNORECASE),
-    re.compile(r"^(please\s+)?subscribe", re.IGNORECASE),
-    re.compile(r"^like\s+and\s+subscribe", re.IGNORECASE),
-    re.compile(r"^see\s+you\s+(next\s+time|later|soon)", re.IGNORECASE),
-    re.compile(r"^bye+$", re.IGNORECASE),
-    re.compile(r"^(uh+|um+|hmm+)$", re.IGNORECASE),
-    re.compile(r"^\.+$"),
+# Phrases Whisper tends to invent on silence, matched against the lowercased
+# transcript after punctuation has been stripped. These must be the whole
+# transcript; "thank you for helping me" is real speech.
+HALLUCINATION_PHRASES = [
+    "thank",
+    "thanks",
+    "thank you",
+    "thanks you",
+    "thank for watching",
+    "thanks for watching",
+    "thank you for watching",
+    "thanks you for watching",
 ]
 
+# These only need to start the transcript
+HALLUCINATION_PREFIX_PHRASES = [
+    "subscribe",
+    "please subscribe",
+    "like and subscribe",
+    "see you next time",
+    "see you later",
+    "see you soon",
+]
+
+
+# Builds a regex for phrases with shared prefixes factored out, so a
+# transcript is checked against one branch per character instead of every
+# phrase in turn. Spaces in the phrases become ``space``.
+def _trie_pattern(phrases: list[str], space: str) -> str:
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_node_pattern(trie, space)
+
+
+def _trie_node_pattern(node: dict, space: str) -> str:
+    branches = [
+        (space if char == " " else re.escape(char)) + _trie_node_pattern(child, space)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if "" in node:
+        return "(?:" + "|".join(branches) + ")?+"
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+_HALLUCINATION_RE = re.compile(
+    "(?:" + _trie_pattern(HALLUCINATION_PHRASES, r"\s*+") + r")\s*+$"
+    "|" + _trie_pattern(HALLUCINATION_PREFIX_PHRASES, r"\s++")
+)
+
+# First two letters of every phrase above; anything else can't match, so
+# most real speech never reaches the regex
+_HALLUCINATION_STARTS = frozenset(
+    phrase[:2] for phrase in HALLUCINATION_PHRASES + HALLUCINATION_PREFIX_PHRASES
+)
+
+# Filler sounds are a stem followed by a repeated letter ("byeee", "uhh",
+# "hmmm"), so they're checked with plain string ops instead of the regex.
+# Maps (stem, letter) to the minimum number of repeats.
+FILLER_SOUNDS = {
+    ("by", "e"): 1,
+    ("u", "h"): 1,
+    ("u", "m"): 1,
+    ("h", "m"): 2,
+}
+
+_PUNCTUATION = re.compile(r"[.!?,]")
+
 MIN_TRANSCRIPT_LENGTH = 2
 
 
+class FilterReason(StrEnum):
+    EMPTY = "empty"
+    NOISE = "noise"
+    HALLUCINATION = "hallucination"
+
+
+# STT keeps producing the same short transcripts ("uh", "thanks", "..."), so
+# verdicts for those are cached; longer ones are rarely repeated
+FILTER_CACHE_SIZE = 2048
+MAX_CACHED_TRANSCRIPT_LENGTH = 128
+
+
+def _normalize(transcript: str) -> str:
+    return _PUNCTUATION.sub("", transcript)
+
+
+def _is_filler(lowered: str) -> bool:
+    letter = lowered[-1:]
+    stem = lowered.rstrip(letter)
+    min_repeats = FILLER_SOUNDS.get((stem, letter))
+    return min_repeats is not None and len(lowered) - len(stem) >= min_repeats
+
+
+def _is_hallucination(normalized: str) -> bool:
+    lowered = normalized.lower()
+    if _is_filler(lowered.rstrip()):
+        return True
+    if lowered[:2] not in _HALLUCINATION_STARTS:
+        return False
+    return _HALLUCINATION_RE.match(lowered) is not None
+
+
 def is_hallucination(transcript: str) -> bool:
-    normalized = re.sub(r"[.!?,]", "", transcript.strip())
-    return any(p.search(normalized) for p in HALLUCINATION_PATTERNS)
+    return _is_hallucination(_normalize(transcript.strip()))
 
 
 def is_too_short(transcript: str) -> bool:
-    normalized = re.sub(r"[.!?,]", "", transcript.strip())
-    return len(normalized) < MIN_TRANSCRIPT_LENGTH
+    return len(_normalize(transcript.strip())) < MIN_TRANSCRIPT_LENGTH
 
 
-def should_filter(transcript: str) -> tuple[bool, str | None]:
+def _classify(transcript: str) -> tuple[bool, FilterReason | None]:
     trimmed = transcript.strip()
 
     if not trimmed:
-        return True, "empty"
+        return True, FilterReason.EMPTY
+
+    # Stripping punctuation only shortens the text, so single characters are
+    # noise without running the substitution
+    if len(trimmed) < MIN_TRANSCRIPT_LENGTH:
+        return True, FilterReason.NOISE
+
+    normalized = _normalize(trimmed)
 
-    if is_too_short(trimmed):
-        return True, "noise"
+    if len(normalized) < MIN_TRANSCRIPT_LENGTH:
+        return True, FilterReason.NOISE
 
-    if is_hallucination(trimmed):
-        return True, "hallucination"
+    if _is_hallucination(normalized):
+        return True, FilterReason.HALLUCINATION
 
     return False, None
 
 
+_classify_cached = functools.lru_cache(maxsize=FILTER_CACHE_SIZE)(_classify)
+
+
+def should_filter(transcript: str) -> tuple[bool, FilterReason | None]:
+    if len(transcript) > MAX_CACHED_TRANSCRIPT_LENGTH:
+        return _classify(transcript)
+    return _classify_cached(transcript)
+
+
+should_filter.cache_clear = _classify_cached.cache_clear
+
+
+def should_filter_batch(transcripts: Iterable[str]) -> list[tuple[bool, FilterReason | None]]:
+    # Hypotheses from one window repeat heavily, so each goes through the cache
+    return [should_filter(transcript) for transcript in transcripts]
+
+
 class HallucinationFilterProcessor(FrameProcessor):
+    __slots__ = ()
+
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
         if isinstance(frame, TranscriptionFrame):
             filtered, reason = should_filter(frame.text)
             if filtered:
+                logger.debug("Filtered {} transcription: {!r}", reason, frame.text)
                 return
 
         await self.push_frame(frame, direction)
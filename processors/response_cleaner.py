@@ -2,112 +2,187 @@ import re
 from pipecat.frames.frames import Frame, TextFrame, LLMFullResponseEndFrame
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 
+from .frame_dispatcher import FrameDispatcher
+
+# Inline markdown we strip for speech, as one alternation so each chunk is
+# scanned once. Every alternative starts with a literal character, which lets
+# the regex engine skip straight to candidate positions; the group name tells
+# _replace_markup what to do with the match. Quantifiers are possessive
+# wherever giving characters back can't produce a match, so unbalanced
+# markup fails in one pass instead of backtracking. A table row runs from
+# the first to the last pipe on the line, with something between them.
+# Header markers need no pattern; every "#" is deleted with str.replace.
+_MARKUP = re.compile(
+    r"```(?P<code>[\s\S]*?)```"
+    r"|\|(?P<table>(?:[^|\n]++\||\|[^|\n]*+\|)(?:[^|\n]*+\|)*+)"
+    r"|\[(?P<link>[^\]]++)\]\([^)]++\)"
+    r"|h(?P<url>ttps?+://\S++)"
+    r"|\*\*(?P<bold>[^*]++)\*\*"
+    r"|\*(?P<italic>[^*]++)\*"
+    r"|`(?P<code_span>[^`]++)`"
+)
+
+# Fixed replacements; the remaining groups unwrap to their inner text
+_MARKUP_REPLACEMENTS = {
+    "code": " (code block omitted) ",
+    "table": "",
+    "url": "",
+}
+
+# OpenClaw echoes the transcription before replying: > 🎤 "text"\n\n, or with
+# 📖 when TTS is muted, or > "text". It uses double newlines, but may also end
+# the echo with a period, and sometimes drops the blockquote marker:
+# 🎤 "text"\n\n. At most one marker token (an emoji or :shortcode:) may sit
+# before the quote, so a blockquote like > He said "hi". is kept.
+_ECHO = re.compile(
+    r'(?:>[ \t]*+(?:[^\s"]++[ \t]*+)?+|[\U0001F3A4\U0001F4D6][ \t]*+)'
+    r'"[^"]*+"(?:\.\s*+|\s*\n+)'
+)
+
+# An echo opens with one of these, or has a quote within the first characters
+_ECHO_STARTS = (">", "\U0001F3A4", "\U0001F4D6")
+
+# Give up waiting for an echo once this much text has buffered without one
+_ECHO_MAX_BUFFER = 512
+
+# Line-level passes that run after the inline markup has been stripped
+_LIST_MARKER = re.compile(r"^(?:[-*]|\d++\.)\s++", re.MULTILINE)
+_EMOJI = re.compile(r"[\U0001F300-\U0001F9FF\u2600-\u27BF\uFE00-\uFE0F\u200D]++")
+_PARAGRAPH_BREAK = re.compile(r"\n{2,}+")
+_WHITESPACE = re.compile(r"\s++")
+
+# Characters that start something _clean_for_speech rewrites
+_MARKUP_CHARS = re.compile(r"[`|\[*#\t\n\r\f\v]")
+
+
+def _needs_clean(text: str) -> bool:
+    # Most streamed tokens are short plain ASCII words; spotting them with a
+    # few C-level checks lets them skip every regex pass
+    return (
+        not text.isascii()
+        or _MARKUP_CHARS.search(text) is not None
+        or "://" in text
+        or "  " in text
+        or text[:1] in ">-0123456789"
+    )
+
+
+def _replace_markup(match: re.Match) -> str:
+    kind = match.lastgroup
+    replacement = _MARKUP_REPLACEMENTS.get(kind)
+    if replacement is not None:
+        return replacement
+    # Link text, bold, italic and inline code can wrap further markup
+    return _MARKUP.sub(_replace_markup, match.group(kind))
+
 
 class ResponseCleanerProcessor(FrameProcessor):
+    __slots__ = ("_buffer", "_buffered_frame", "_echo_stripped", "_dispatcher")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._buffer = ""
+        self._buffered_frame: TextFrame | None = None
         self._echo_stripped = False
+        self._dispatcher = FrameDispatcher({
+            LLMFullResponseEndFrame: self._on_response_end,
+            TextFrame: self._on_text,
+        })
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, LLMFullResponseEndFrame):
-            # Flush any remaining buffer
-            if self._buffer:
-                cleaned = self._clean_for_speech(self._buffer)
-                if cleaned:
-                    await self.push_frame(TextFrame(text=cleaned), direction)
-            self._buffer = ""
-            self._echo_stripped = False
+        handler = self._dispatcher.get(type(frame))
+        if handler:
+            await handler(frame, direction)
+        else:
             await self.push_frame(frame, direction)
-            return
-
-        if isinstance(frame, TextFrame):
-            text = frame.text
-
-            if not self._echo_stripped:
-                # Accumulate until we can identify and strip the echo
-                self._buffer += text
-
-                # Look for the echo pattern: > 🎤 "..."\n\n or > "...".
-                # OpenClaw echoes with double newlines, but may also use period
-                # Pattern handles: > 🎤 "text"\n\n or > "text".
-                match = re.search(r'^>[^"]*"[^"]*"(?:\.\s*|\s*\n+)', self._buffer)
-                if match:
-                    # Found complete echo, strip it
-                    self._buffer = self._buffer[match.end():]
-                    self._echo_stripped = True
-                    if self._buffer:
-                        cleaned = self._clean_for_speech(self._buffer)
-                        if cleaned:
-                            await self.push_frame(TextFrame(text=cleaned), direction)
-                        self._buffer = ""
-                elif not self._buffer.startswith('>') and '"' not in self._buffer[:10]:
-                    # Doesn't look like an echo, pass through
-                    self._echo_stripped = True
-                    cleaned = self._clean_for_speech(self._buffer)
-                    if cleaned:
-                        await self.push_frame(TextFrame(text=cleaned), direction)
-                    self._buffer = ""
-                # else: still accumulating, waiting for echo to complete
-                return
-
-            # Echo already stripped, just clean and pass through
-            cleaned = self._clean_for_speech(text)
-            if cleaned:
-                frame = TextFrame(text=cleaned)
-                await self.push_frame(frame, direction)
-            return
 
+    async def _on_response_end(self, frame: LLMFullResponseEndFrame, direction: FrameDirection):
+        # Flush any remaining buffer
+        if self._buffer:
+            await self._flush_buffer(self._buffered_frame, direction)
+        self._buffered_frame = None
+        self._echo_stripped = False
         await self.push_frame(frame, direction)
 
-    def _clean_for_speech(self, text: str) -> str:
-        # Remove code blocks
-        text = re.sub(r"```[\s\S]*?```", " (code block omitted) ", text)
-
-        # Remove table rows
-        text = re.sub(r"\|[^\n]+\|", "", text)
+    async def _on_text(self, frame: TextFrame, direction: FrameDirection):
+        text = frame.text
+
+        if not self._echo_stripped:
+            # Accumulate until we can identify and strip the echo
+            self._buffer += text
+            self._buffered_frame = frame
+
+            match = _ECHO.match(self._buffer)
+            if match:
+                # Found complete echo, strip it
+                self._buffer = self._buffer[match.end():]
+                self._echo_stripped = True
+                if self._buffer:
+                    await self._flush_buffer(frame, direction)
+            elif (
+                (not self._buffer.startswith(_ECHO_STARTS) and '"' not in self._buffer[:10])
+                or len(self._buffer) > _ECHO_MAX_BUFFER
+            ):
+                # Doesn't look like an echo, pass through
+                self._echo_stripped = True
+                await self._flush_buffer(frame, direction)
+            # else: still accumulating, waiting for echo to complete
+            return
 
-        # [link text](url) -> link text
-        text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
+        # Echo already stripped. Forward the original frame, cleaning its
+        # text in place when needed, so the LLM frame type and flags survive.
+        if not _needs_clean(text) and not text.isspace():
+            await self.push_frame(frame, direction)
+            return
 
-        # Remove raw URLs
-        text = re.sub(r"https?://\S+", "", text)
+        cleaned = self._clean_for_speech(text, strip_echo=False)
+        if cleaned:
+            frame.text = cleaned
+            await self.push_frame(frame, direction)
 
-        # **bold** -> bold
-        text = re.sub(r"\*\*([^*]+)\*\*", r"\1", text)
+    async def _flush_buffer(self, frame: TextFrame, direction: FrameDirection):
+        # Send the buffered text in the latest buffered frame, so it keeps the
+        # frame type (and LLMTextFrame's spacing flag) like every other chunk
+        cleaned = self._clean_for_speech(self._buffer, strip_echo=False)
+        self._buffer = ""
+        if cleaned:
+            frame.text = cleaned
+            await self.push_frame(frame, direction)
 
-        # *italic* -> italic
-        text = re.sub(r"\*([^*]+)\*", r"\1", text)
+    def _clean_for_speech(self, text: str, strip_echo: bool = True) -> str:
+        if not _needs_clean(text):
+            return text if text.strip() else ""
 
-        # `code` -> code
-        text = re.sub(r"`([^`]+)`", r"\1", text)
+        # Strip a leading echo of the transcription when cleaning a whole
+        # response. The processor handles the echo in its buffer and passes
+        # False, since later quoted blockquotes are content.
+        if strip_echo:
+            echo = _ECHO.match(text)
+            if echo:
+                text = text[echo.end():]
 
-        # Remove headers
-        text = re.sub(r"#{1,6}\s*", "", text)
+        # Strip inline markup in a single pass
+        text = _MARKUP.sub(_replace_markup, text)
 
-        # Remove bullet points
-        text = re.sub(r"^[-*]\s+", "", text, flags=re.MULTILINE)
+        # Remove header markers; the whitespace after them is collapsed below
+        if "#" in text:
+            text = text.replace("#", "")
 
-        # Remove numbered lists
-        text = re.sub(r"^\d+\.\s+", "", text, flags=re.MULTILINE)
+        # Remove bullet points and numbered lists
+        text = _LIST_MARKER.sub("", text)
 
-        # Remove emojis
-        text = re.sub(r"[\U0001F300-\U0001F9FF]", "", text)
-        text = re.sub(r"[\u2600-\u26FF]", "", text)
-        text = re.sub(r"[\u2700-\u27BF]", "", text)
-        text = re.sub(r"[\uFE00-\uFE0F]", "", text)
-        text = re.sub(r"[\u200D]", "", text)
+        # Remove emojis (isascii is O(1), so plain-ASCII chunks skip the scan)
+        if not text.isascii():
+            text = _EMOJI.sub("", text)
 
         # Multiple newlines -> pause
-        text = re.sub(r"\n{2,}", ". ", text)
-
-        # Single newlines -> space
-        text = re.sub(r"\n", " ", text)
+        text = _PARAGRAPH_BREAK.sub(". ", text)
 
-        # Normalize internal whitespace (but preserve leading/trailing for concatenation)
-        text = re.sub(r"\s+", " ", text)
+        # Normalize whitespace, including single newlines (but preserve
+        # leading/trailing for concatenation)
+        text = _WHITESPACE.sub(" ", text)
 
         # Return text with spaces preserved, or empty if all whitespace
         return text if text.strip() else ""
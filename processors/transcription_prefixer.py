@@ -7,43 +7,63 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 from pipecat.transports.smallwebrtc.connection import SmallWebRTCConnection
 
+from .frame_dispatcher import FrameDispatcher
+
+# Tells the agent whether its reply will be spoken (see CLAUDE.md)
+_EMOJI_MIC = "\U0001F3A4"
+_EMOJI_BOOK = "\U0001F4D6"
+
 
 class TranscriptionPrefixerProcessor(FrameProcessor):
+    __slots__ = ("_connection", "_tts_enabled", "_dispatcher")
+
+    _MSG_RECORDING = {"type": "state", "state": "recording"}
+    _MSG_PROCESSING = {"type": "state", "state": "processing"}
+
     def __init__(self, connection: SmallWebRTCConnection, **kwargs):
         super().__init__(**kwargs)
         self._connection = connection
         self._tts_enabled = True
+        self._dispatcher = FrameDispatcher({
+            UserStartedSpeakingFrame: self._on_user_started_speaking,
+            UserStoppedSpeakingFrame: self._on_user_stopped_speaking,
+            TranscriptionFrame: self._on_transcription,
+        })
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, UserStartedSpeakingFrame):
-            self._send_state("recording")
-
-        elif isinstance(frame, UserStoppedSpeakingFrame):
-            self._send_state("processing")
-
-        elif isinstance(frame, TranscriptionFrame):
-            # Send original text to UI before prefixing
-            self._send_message({
-                "type": "transcription",
-                "text": frame.text,
-                "final": True,
-            })
-
-            # Prefix for LLM context
-            emoji = "\U0001F3A4" if self._tts_enabled else "\U0001F4D6"
-            prefixed_text = f'{emoji} "{frame.text}"'
-            frame = TranscriptionFrame(
-                text=prefixed_text,
-                user_id=frame.user_id,
-                timestamp=frame.timestamp,
-            )
+        handler = self._dispatcher.get(type(frame))
+        if handler:
+            await handler(frame, direction)
+        else:
+            await self.push_frame(frame, direction)
 
+    async def _on_user_started_speaking(
+        self, frame: UserStartedSpeakingFrame, direction: FrameDirection
+    ):
+        self._send_message(self._MSG_RECORDING)
         await self.push_frame(frame, direction)
 
-    def _send_state(self, state: str):
-        self._send_message({"type": "state", "state": state})
+    async def _on_user_stopped_speaking(
+        self, frame: UserStoppedSpeakingFrame, direction: FrameDirection
+    ):
+        self._send_message(self._MSG_PROCESSING)
+        await self.push_frame(frame, direction)
+
+    async def _on_transcription(self, frame: TranscriptionFrame, direction: FrameDirection):
+        # Send original text to UI before prefixing
+        self._send_message({
+            "type": "transcription",
+            "text": frame.text,
+            "final": True,
+        })
+
+        # Prefix for LLM context, rewriting the frame in place so any other
+        # fields set by the STT service are kept
+        emoji = _EMOJI_MIC if self._tts_enabled else _EMOJI_BOOK
+        frame.text = f'{emoji} "{frame.text}"'
+        await self.push_frame(frame, direction)
 
     def _send_message(self, msg: dict):
         self._connection.send_app_message(msg)
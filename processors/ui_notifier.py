@@ -1,3 +1,5 @@
+import asyncio
+
 from pipecat.frames.frames import (
     Frame,
     TextFrame,
@@ -6,34 +8,71 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 from pipecat.transports.smallwebrtc.connection import SmallWebRTCConnection
 
+from .frame_dispatcher import FrameDispatcher
+
+# Streamed tokens arriving within this window are sent as a single message
+RESPONSE_FLUSH_DELAY = 0.015
+
 
 class UINotifierProcessor(FrameProcessor):
+    __slots__ = ("_connection", "_saw_text", "_pending_text", "_flush_handle", "_dispatcher")
+
+    _MSG_RESPONSE_DONE = {"type": "response", "text": "", "done": True}
+
     def __init__(self, connection: SmallWebRTCConnection, **kwargs):
         super().__init__(**kwargs)
         self._connection = connection
-        self._current_response = ""
+        self._saw_text = False
+        self._pending_text: list[str] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._dispatcher = FrameDispatcher({
+            TextFrame: self._on_text,
+            LLMFullResponseEndFrame: self._on_response_end,
+        })
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, TextFrame):
-            self._current_response += frame.text
+        handler = self._dispatcher.get(type(frame))
+        if handler:
+            await handler(frame, direction)
+        else:
+            await self.push_frame(frame, direction)
+
+    async def _on_text(self, frame: TextFrame, direction: FrameDirection):
+        self._saw_text = True
+        self._pending_text.append(frame.text)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                RESPONSE_FLUSH_DELAY, self._flush_response
+            )
+        await self.push_frame(frame, direction)
+
+    async def _on_response_end(self, frame: LLMFullResponseEndFrame, direction: FrameDirection):
+        if self._saw_text:
+            self._flush_response()
+            self._send_message(self._MSG_RESPONSE_DONE)
+            self._saw_text = False
+        await self.push_frame(frame, direction)
+
+    async def cleanup(self):
+        self._cancel_flush()
+        await super().cleanup()
+
+    def _flush_response(self):
+        self._cancel_flush()
+        if self._pending_text:
             self._send_message({
                 "type": "response",
-                "text": frame.text,
+                "text": "".join(self._pending_text),
                 "done": False,
             })
+            self._pending_text.clear()
 
-        elif isinstance(frame, LLMFullResponseEndFrame):
-            if self._current_response:
-                self._send_message({
-                    "type": "response",
-                    "text": "",
-                    "done": True,
-                })
-                self._current_response = ""
-
-        await self.push_frame(frame, direction)
+    def _cancel_flush(self):
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
 
     def _send_message(self, msg: dict):
         self._connection.send_app_message(msg)
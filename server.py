@@ -1,6 +1,7 @@
 import asyncio
 import os
 import sys
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Dict
@@ -36,11 +37,26 @@ rate_limits: dict[str, dict] = {}
 RATE_LIMIT_REQUESTS = 20
 RATE_LIMIT_WINDOW_MS = 60 * 1000
 
+# Drop expired entries every N checks so IPs seen once don't stay forever
+RATE_LIMIT_SWEEP_INTERVAL = 1024
+rate_limit_checks = 0
+
+
+def evict_expired_rate_limits(now: int):
+    expired = [ip for ip, limit in rate_limits.items() if now > limit["reset_at"]]
+    for ip in expired:
+        del rate_limits[ip]
+
 
 def check_rate_limit(ip: str) -> bool:
-    import time
+    global rate_limit_checks
+
+    now = time.time_ns() // 1_000_000
+
+    rate_limit_checks += 1
+    if rate_limit_checks % RATE_LIMIT_SWEEP_INTERVAL == 0:
+        evict_expired_rate_limits(now)
 
-    now = int(time.time() * 1000)
     limit = rate_limits.get(ip)
 
     if not limit or now > limit["reset_at"]:
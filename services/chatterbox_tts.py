@@ -1,11 +1,24 @@
+import json
 import aiohttp
 from typing import AsyncGenerator
 
+from loguru import logger
 from pipecat.frames.frames import Frame, TTSAudioRawFrame, TTSStartedFrame, TTSStoppedFrame
 from pipecat.services.tts_service import TTSService
 
+from .wav import parse_wav_header
+
+# Bytes read from the response per audio frame
+AUDIO_CHUNK_SIZE = 8192
+
+# Keep connections to Chatterbox open between utterances
+CONNECTION_LIMIT = 32
+KEEPALIVE_TIMEOUT = 60
+
 
 class ChatterboxTTSService(TTSService):
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+
     def __init__(
         self,
         url: str = "http://localhost:8880",
@@ -14,12 +27,22 @@ class ChatterboxTTSService(TTSService):
     ):
         super().__init__(sample_rate=sample_rate)
         self._url = url.rstrip("/")
+        self._speech_url = f"{self._url}/v1/audio/speech"
+        self._health_url = f"{self._url}/health"
         self._voice = voice
+        # Only the input text changes between requests, so the rest of the
+        # JSON body is serialized once, minus its opening brace
+        self._payload_suffix = json.dumps(
+            {"voice": voice, "response_format": "wav"}
+        )[1:].encode()
         self._session: aiohttp.ClientSession | None = None
+        self._warned_sample_rate = False
 
     async def start(self, frame: Frame):
         await super().start(frame)
-        self._session = aiohttp.ClientSession()
+        # health_check may already have opened the session (and a connection)
+        if not self._session:
+            self._session = self._create_session()
 
     async def stop(self, frame: Frame):
         if self._session:
@@ -28,43 +51,81 @@ class ChatterboxTTSService(TTSService):
         await super().stop(frame)
 
     async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
-        if not self._session:
-            self._session = aiohttp.ClientSession()
-
         yield TTSStartedFrame()
 
         try:
+            payload = b'{"input": ' + json.dumps(text).encode() + b", " + self._payload_suffix
             async with self._session.post(
-                f"{self._url}/v1/audio/speech",
-                json={
-                    "input": text,
-                    "voice": self._voice,
-                    "response_format": "wav",
-                },
+                self._speech_url,
+                data=payload,
+                headers=self._JSON_HEADERS,
             ) as response:
-                if not response.ok:
-                    error_text = await response.text()
-                    raise RuntimeError(f"Chatterbox TTS failed ({response.status}): {error_text}")
-
-                # Read full response (Chatterbox doesn't stream)
-                audio_data = await response.read()
-
-                # Skip WAV header (44 bytes) and yield raw PCM
-                if len(audio_data) > 44:
-                    yield TTSAudioRawFrame(
-                        audio=audio_data[44:],
-                        sample_rate=self._sample_rate,
-                        num_channels=1,
-                    )
+                # Stream the PCM as it arrives instead of waiting for the
+                # whole file. The start is buffered until the WAV header has
+                # been parsed, however it is split across chunks.
+                header = b""
+                data_offset = None
+                sample_rate = self._sample_rate
+                carry = b""
+                async for chunk in response.content.iter_chunked(AUDIO_CHUNK_SIZE):
+                    if data_offset is None:
+                        header += chunk
+                        parsed = parse_wav_header(header)
+                        if parsed is None:
+                            continue
+                        data_offset, wav_sample_rate = parsed
+                        chunk = header[data_offset:]
+                        header = b""
+                        if wav_sample_rate and wav_sample_rate != sample_rate:
+                            self._warn_sample_rate(wav_sample_rate)
+                            sample_rate = wav_sample_rate
+                    if carry:
+                        chunk = carry + chunk
+
+                    # Frames must hold whole 16-bit samples; hold back an odd byte.
+                    # Slicing a whole chunk returns the received bytes object
+                    # itself, so only odd-sized chunks are copied. Frames keep
+                    # getting bytes: AudioRawFrame.audio is declared as bytes,
+                    # and mixers and serializers downstream rely on that.
+                    usable = len(chunk) & ~1
+                    carry = chunk[usable:]
+                    if usable:
+                        yield TTSAudioRawFrame(
+                            audio=chunk[:usable],
+                            sample_rate=sample_rate,
+                            num_channels=1,
+                        )
+        except aiohttp.ClientResponseError as e:
+            raise RuntimeError(f"Chatterbox TTS failed ({e.status}): {e.message}")
         finally:
             yield TTSStoppedFrame()
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ),
+            raise_for_status=True,
+        )
+
+    def _warn_sample_rate(self, wav_sample_rate: int):
+        # Frames carry the rate Chatterbox actually produced, so playback
+        # stays correct; the mismatch only costs a resample downstream
+        if not self._warned_sample_rate:
+            logger.warning(
+                "Chatterbox returned {} Hz audio, expected {} Hz",
+                wav_sample_rate,
+                self._sample_rate,
+            )
+            self._warned_sample_rate = True
+
     async def health_check(self) -> bool:
         try:
             if not self._session:
-                self._session = aiohttp.ClientSession()
+                self._session = self._create_session()
 
-            async with self._session.get(f"{self._url}/health") as response:
+            async with self._session.get(self._health_url) as response:
                 return response.ok
         except Exception:
             return False
@@ -0,0 +1,28 @@
+import struct
+
+
+# Locates the PCM samples in the start of a WAV file. Returns (data_offset,
+# sample_rate) once data reaches the start of the data chunk, or None if more
+# bytes are needed. Chunks such as LIST can sit between fmt and data, so the
+# header isn't always 44 bytes.
+def parse_wav_header(data: bytes) -> tuple[int, int | None] | None:
+    if len(data) < 12:
+        return None
+    riff, _, wave = struct.unpack_from("<4sI4s", data, 0)
+    if riff != b"RIFF" or wave != b"WAVE":
+        raise ValueError("Expected a RIFF/WAVE stream")
+
+    offset = 12
+    sample_rate = None
+    while offset + 8 <= len(data):
+        chunk_id, chunk_size = struct.unpack_from("<4sI", data, offset)
+        offset += 8
+        if chunk_id == b"data":
+            return offset, sample_rate
+        if chunk_id == b"fmt ":
+            if offset + 8 > len(data):
+                return None
+            (sample_rate,) = struct.unpack_from("<I", data, offset + 4)
+        # Chunks are padded to an even size
+        offset += chunk_size + (chunk_size & 1)
+    return None
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import asyncio
-import json
 import os
 import sys
 from pathlib import Path
@@ -8,6 +7,8 @@ from pathlib import Path
 from dotenv import load_dotenv
 import aiohttp
 
+from config import dig, read_openclaw_config
+
 load_dotenv()
 
 
@@ -17,13 +18,13 @@ def load_gateway_config():
     config_path = home / ".openclaw" / "openclaw.json"
 
     try:
-        openclaw_config = json.loads(config_path.read_text())
+        openclaw_config = read_openclaw_config(config_path)
         print(f"Loaded {config_path}")
     except Exception as e:
         raise RuntimeError(f"Could not load openclaw.json: {e}")
 
-    gateway_port = openclaw_config.get("gateway", {}).get("port", 18789)
-    gateway_token = openclaw_config.get("gateway", {}).get("auth", {}).get("token", "")
+    gateway_port = dig(openclaw_config, "gateway", "port", default=18789)
+    gateway_token = dig(openclaw_config, "gateway", "auth", "token", default="")
     gateway_url = os.environ.get("GATEWAY_URL", f"http://localhost:{gateway_port}")
     session_key = os.environ.get("SESSION_KEY", "agent:main:main")
 
@@ -53,7 +54,8 @@ async def test_gateway_chat_completions():
     print(f"  URL: {url}")
     print(f"  Session: {session_key}")
 
-    async with aiohttp.ClientSession() as session:
+    connector = aiohttp.TCPConnector(limit=4, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
         try:
             async with session.post(url, json=body, headers=headers) as resp:
                 if resp.status == 200:
@@ -0,0 +1,103 @@
+import io
+import itertools
+import json
+import struct
+import wave
+
+import pytest
+from pipecat.frames.frames import TTSAudioRawFrame, TTSStartedFrame, TTSStoppedFrame
+from services.chatterbox_tts import ChatterboxTTSService
+
+PCM = bytes(range(256)) * 8
+
+
+def make_wav(sample_rate):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(PCM)
+    data = buf.getvalue()
+    # An odd-sized LIST chunk (padded to even) pushes data past byte 44
+    info = b"LIST" + struct.pack("<I", 5) + b"INFOx\x00"
+    i = data.index(b"data")
+    data = data[:i] + info + data[i:]
+    return data[:4] + struct.pack("<I", len(data) - 8) + data[8:]
+
+
+class FakeContent:
+    def __init__(self, body, chunk_sizes):
+        self._body = body
+        self._chunk_sizes = chunk_sizes
+
+    async def iter_chunked(self, n):
+        offset = 0
+        for size in itertools.cycle(self._chunk_sizes):
+            if offset >= len(self._body):
+                return
+            chunk = self._body[offset:offset + min(size, n)]
+            offset += len(chunk)
+            yield chunk
+
+
+class FakeResponse:
+    def __init__(self, body, chunk_sizes):
+        self.content = FakeContent(body, chunk_sizes)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, body, chunk_sizes):
+        self._body = body
+        self._chunk_sizes = chunk_sizes
+        self.requests = []
+
+    def post(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        return FakeResponse(self._body, self._chunk_sizes)
+
+
+async def synthesize(tts, text):
+    return [frame async for frame in tts.run_tts(text)]
+
+
+class TestChatterboxTTSStreaming:
+    def setup_method(self):
+        self.tts = ChatterboxTTSService(url="http://chatterbox:8880/", voice="ana")
+        # Set by start() from the pipeline's output rate
+        self.tts._sample_rate = 24000
+
+    @pytest.mark.parametrize("chunk_sizes", [[7], [3, 50, 1], [13, 2]])
+    async def test_streams_pcm_in_whole_samples(self, chunk_sizes):
+        self.tts._session = FakeSession(make_wav(16000), chunk_sizes)
+
+        frames = await synthesize(self.tts, "hello")
+
+        assert isinstance(frames[0], TTSStartedFrame)
+        assert isinstance(frames[-1], TTSStoppedFrame)
+        audio = frames[1:-1]
+        assert audio and all(isinstance(frame, TTSAudioRawFrame) for frame in audio)
+        assert b"".join(frame.audio for frame in audio) == PCM
+        assert all(len(frame.audio) % 2 == 0 for frame in audio)
+        assert all(frame.sample_rate == 16000 for frame in audio)
+
+    async def test_request_body(self):
+        session = FakeSession(make_wav(24000), [4096])
+        self.tts._session = session
+
+        await synthesize(self.tts, 'Say "hi" é')
+
+        [(url, kwargs)] = session.requests
+        assert url == "http://chatterbox:8880/v1/audio/speech"
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        assert json.loads(kwargs["data"]) == {
+            "input": 'Say "hi" é',
+            "voice": "ana",
+            "response_format": "wav",
+        }
@@ -0,0 +1,35 @@
+from pipecat.frames.frames import (
+    LLMFullResponseEndFrame,
+    LLMTextFrame,
+    TextFrame,
+    TranscriptionFrame,
+)
+from processors.frame_dispatcher import FrameDispatcher
+
+
+async def on_text(frame, direction):
+    pass
+
+
+async def on_end(frame, direction):
+    pass
+
+
+class TestFrameDispatcher:
+    def setup_method(self):
+        self.dispatcher = FrameDispatcher({
+            TextFrame: on_text,
+            LLMFullResponseEndFrame: on_end,
+        })
+
+    def test_exact_type(self):
+        assert self.dispatcher.get(TextFrame) is on_text
+        assert self.dispatcher.get(LLMFullResponseEndFrame) is on_end
+
+    def test_subclass_resolves_to_base_handler(self):
+        assert self.dispatcher.get(LLMTextFrame) is on_text
+        assert self.dispatcher.get(TranscriptionFrame) is on_text
+
+    def test_unhandled_type(self):
+        assert self.dispatcher.get(int) is None
+        assert self.dispatcher.get(int) is None
@@ -1,5 +1,11 @@
 import pytest
-from processors.hallucination_filter import should_filter, is_hallucination, is_too_short
+from processors.hallucination_filter import (
+    FilterReason,
+    is_hallucination,
+    is_too_short,
+    should_filter,
+    should_filter_batch,
+)
 
 
 class TestIsHallucination:
@@ -81,8 +87,22 @@ class TestShouldFilter:
         filtered, reason = should_filter("thanks for watching")
         assert filtered
         assert reason == "hallucination"
+        assert reason is FilterReason.HALLUCINATION
 
     def test_valid(self):
         filtered, reason = should_filter("what time is it?")
         assert not filtered
         assert reason is None
+
+    def test_repeated_and_long_transcripts(self):
+        should_filter.cache_clear()
+        assert should_filter("thanks") == (True, "hallucination")
+        assert should_filter("thanks") == (True, "hallucination")
+        long_text = "tell me a story " * 20
+        assert should_filter(long_text) == (False, None)
+        assert should_filter("see you later " + long_text) == (True, "hallucination")
+
+    def test_batch(self):
+        transcripts = ["", "a", "thanks for watching", "what time is it?"]
+        assert should_filter_batch(transcripts) == [should_filter(t) for t in transcripts]
+        assert should_filter_batch([]) == []
@@ -1,5 +1,7 @@
 import pytest
-from processors.response_cleaner import ResponseCleanerProcessor
+from pipecat.frames.frames import LLMFullResponseEndFrame, LLMTextFrame, TextFrame
+from pipecat.tests.utils import run_test
+from processors.response_cleaner import _ECHO_MAX_BUFFER, ResponseCleanerProcessor
 
 
 class TestResponseCleaner:
@@ -41,6 +43,11 @@ class TestResponseCleaner:
         assert "`" not in result
         assert "print" in result
 
+    def test_strip_nested_markup(self):
+        text = "See **[the docs](https://example.com)** or `*this*`."
+        result = self.cleaner._clean_for_speech(text)
+        assert result == "See the docs or this."
+
     def test_strip_headers(self):
         text = "# Title\n## Subtitle\nContent here."
         result = self.cleaner._clean_for_speech(text)
@@ -99,3 +106,59 @@ class TestResponseCleaner:
         text = "The weather today is sunny with a high of 72 degrees."
         result = self.cleaner._clean_for_speech(text)
         assert result == text
+
+    def test_keep_blockquote_that_is_not_an_echo(self):
+        text = '> He said "hello". Then left.'
+        result = self.cleaner._clean_for_speech(text)
+        assert "He said" in result
+        assert "Then left" in result
+
+
+async def run_response(tokens, end_response=True):
+    frames = [LLMTextFrame(text=token) for token in tokens]
+    if end_response:
+        frames.append(LLMFullResponseEndFrame())
+    down, _ = await run_test(ResponseCleanerProcessor(), frames_to_send=frames)
+    return [frame for frame in down if isinstance(frame, TextFrame)]
+
+
+class TestResponseCleanerStreaming:
+    async def test_strip_muted_echo(self):
+        frames = await run_response(['> 📖 "Show me', ' the logs"\n\n', "Here they are."])
+        assert [frame.text for frame in frames] == ["Here they are."]
+
+    async def test_strip_bare_emoji_echo_split_across_tokens(self):
+        frames = await run_response(["🎤", ' "What', ' time?"\n\n', "It's 3."])
+        assert [frame.text for frame in frames] == ["It's 3."]
+
+    async def test_quoted_blockquote_after_echo_is_spoken(self):
+        frames = await run_response(['> 🎤 "quote?"\n\n', '> "Stay hungry". Jobs said that.'])
+        spoken = "".join(frame.text for frame in frames)
+        assert "quote?" not in spoken
+        assert '"Stay hungry". Jobs said that.' in spoken
+
+    async def test_blockquote_without_echo_waits_for_more_text(self):
+        # Looks like it could still become an echo, and the response hasn't ended
+        frames = await run_response(["> Roses are red,", " violets are blue"], end_response=False)
+        assert frames == []
+
+    async def test_blockquote_without_echo_released_at_buffer_cap(self):
+        tokens = ["> Roses are red,"] + [" and violets are blue"] * 30
+        assert len("".join(tokens)) > _ECHO_MAX_BUFFER
+
+        # No end of response, so only the cap can release the buffer
+        frames = await run_response(tokens, end_response=False)
+        spoken = "".join(frame.text for frame in frames)
+        assert spoken.startswith("> Roses are red, and violets are blue")
+        assert spoken.count("violets") == 30
+
+    async def test_frames_keep_their_type_after_echo(self):
+        frames = await run_response(['> 🎤 "What', ' time?"\n\n', "It's", " **3** PM", "."])
+        assert "".join(frame.text for frame in frames) == "It's 3 PM."
+        assert all(type(frame) is LLMTextFrame for frame in frames)
+        assert all(frame.includes_inter_frame_spaces for frame in frames)
+
+    async def test_flush_at_response_end_keeps_frame_type(self):
+        frames = await run_response(["> Roses", " are red"])
+        assert [frame.text for frame in frames] == ["> Roses are red"]
+        assert type(frames[0]) is LLMTextFrame
@@ -0,0 +1,66 @@
+import asyncio
+
+from pipecat.frames.frames import LLMFullResponseEndFrame, TextFrame
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.tests.utils import run_test
+from processors import ui_notifier
+from processors.ui_notifier import RESPONSE_FLUSH_DELAY, UINotifierProcessor
+
+
+class FakeConnection:
+    def __init__(self):
+        self.messages = []
+
+    def send_app_message(self, message):
+        self.messages.append(message)
+
+
+def response(text):
+    return {"type": "response", "text": text, "done": False}
+
+
+DONE = {"type": "response", "text": "", "done": True}
+
+
+class TestUINotifier:
+    def setup_method(self):
+        self.connection = FakeConnection()
+        self.notifier = UINotifierProcessor(connection=self.connection)
+
+    async def test_tokens_in_one_window_are_merged(self):
+        await self.notifier._on_text(TextFrame(text="Hel"), FrameDirection.DOWNSTREAM)
+        timer = self.notifier._flush_handle
+        await self.notifier._on_text(TextFrame(text="lo"), FrameDirection.DOWNSTREAM)
+        assert self.notifier._flush_handle is timer
+        assert self.connection.messages == []
+
+        # Fire the window's timer by hand rather than waiting on the clock
+        self.notifier._flush_response()
+        await self.notifier._on_text(TextFrame(text=" world"), FrameDirection.DOWNSTREAM)
+        self.notifier._flush_response()
+        await self.notifier.cleanup()
+
+        assert self.connection.messages == [response("Hello"), response(" world")]
+
+    async def test_pending_text_is_sent_before_done(self, monkeypatch):
+        # Keep the timer from firing, so only the end of response flushes
+        monkeypatch.setattr(ui_notifier, "RESPONSE_FLUSH_DELAY", 60)
+        await run_test(
+            self.notifier,
+            frames_to_send=[
+                TextFrame(text="Hello"),
+                TextFrame(text=" world"),
+                LLMFullResponseEndFrame(),
+            ],
+        )
+        assert self.connection.messages == [response("Hello world"), DONE]
+
+    async def test_no_done_without_text(self):
+        await run_test(self.notifier, frames_to_send=[LLMFullResponseEndFrame()])
+        assert self.connection.messages == []
+
+    async def test_no_flush_after_cleanup(self):
+        await self.notifier._on_text(TextFrame(text="Hello"), FrameDirection.DOWNSTREAM)
+        await self.notifier.cleanup()
+        await asyncio.sleep(RESPONSE_FLUSH_DELAY * 4)
+        assert self.connection.messages == []
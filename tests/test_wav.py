@@ -0,0 +1,41 @@
+import io
+import struct
+import wave
+
+import pytest
+from services.wav import parse_wav_header
+
+
+def make_wav(sample_rate=24000, extra_chunk=b""):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(b"\x01\x02" * 100)
+    data = buf.getvalue()
+    if extra_chunk:
+        i = data.index(b"data")
+        data = data[:i] + extra_chunk + data[i:]
+    return data
+
+
+class TestParseWavHeader:
+    def test_canonical_header(self):
+        assert parse_wav_header(make_wav()) == (44, 24000)
+
+    def test_extra_chunk_before_data(self):
+        # Odd-sized chunks are padded to an even length
+        info = b"LIST" + struct.pack("<I", 5) + b"INFOx\x00"
+        data = make_wav(16000, extra_chunk=info)
+        assert parse_wav_header(data) == (58, 16000)
+        assert data[58:60] == b"\x01\x02"
+
+    def test_needs_more_bytes(self):
+        data = make_wav()
+        for size in (0, 11, 20, 43):
+            assert parse_wav_header(data[:size]) is None
+
+    def test_not_wav(self):
+        with pytest.raises(ValueError):
+            parse_wav_header(b"ID3\x03" + b"\x00" * 40)